@@ -4,7 +4,6 @@ import os
 from typing import get_args
 
 from collections import defaultdict
-import jinja2
 from enum import Enum
 from natsort import natsorted
 
@@ -80,6 +79,9 @@ def group_by_make(all_car_docs: list[CarDocs]) -> dict[str, list[CarDocs]]:
 
 # CAUTION: This function is imported by shop.comma.ai and comma.ai/vehicles, test changes carefully
 def generate_cars_md(all_car_docs: list[CarDocs], template_fn: str, **kwargs) -> str:
+  # only needed for rendering, get_all_car_docs consumers shouldn't pay for it
+  import jinja2
+
   with open(template_fn) as f:
     template = jinja2.Template(f.read(), trim_blocks=True, lstrip_blocks=True)
 
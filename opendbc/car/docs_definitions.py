@@ -1,14 +1,14 @@
 import re
-from collections import namedtuple
-import copy
+from collections import Counter, namedtuple
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import chain
 
 from opendbc.car.common.conversions import Conversions as CV
 from opendbc.car.structs import CarParams
 
 GOOD_TORQUE_THRESHOLD = 1.0  # m/s^2
-MODEL_YEARS_RE = r"(?<= )((\d{4}-\d{2})|(\d{4}))(,|$)"
+MODEL_YEARS_RE = re.compile(r"(?<= )((\d{4}-\d{2})|(\d{4}))(,|$)")
 
 
 class Column(Enum):
@@ -48,7 +48,7 @@ class Star(Enum):
 
 
 # A part + its comprised parts
-@dataclass
+@dataclass(slots=True)
 class BasePart:
   name: str
   parts: list[Enum] = field(default_factory=list)
@@ -91,7 +91,7 @@ class Tool(EnumBase):
   pry_tool = BasePart("Pry Tool")
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseCarHarness(BasePart):
   parts: list[Enum] = field(default_factory=lambda: [Accessory.harness_box, Accessory.comma_power])
   has_connector: bool = True  # without are hidden on the harness connector page
@@ -158,26 +158,24 @@ class PartType(Enum):
   tool = Tool
 
 
-DEFAULT_CAR_PARTS: list[EnumBase] = [Device.four]
+DEFAULT_CAR_PARTS: tuple[EnumBase, ...] = (Device.four,)
 
 
-@dataclass
+@dataclass(slots=True)
 class CarParts:
   parts: list[EnumBase] = field(default_factory=list)
 
   def __call__(self):
-    return copy.deepcopy(self)
+    # parts are enum members, so a shallow copy of the list is enough
+    return type(self)(self.parts.copy())
 
   @classmethod
   def common(cls, add: list[EnumBase] | None = None, remove: list[EnumBase] | None = None):
-    p = [part for part in (add or []) + DEFAULT_CAR_PARTS if part not in (remove or [])]
+    p = [part for part in (*(add or []), *DEFAULT_CAR_PARTS) if part not in (remove or [])]
     return cls(p)
 
   def all_parts(self):
-    parts = []
-    for part in self.parts:
-      parts.extend(part.value.all_parts())
-    return self.parts + parts
+    return self.parts + list(chain.from_iterable(part.value.all_parts() for part in self.parts))
 
 
 CarFootnote = namedtuple("CarFootnote", ["text", "column", "docs_only", "setup_note"], defaults=(False, False))
@@ -195,6 +193,12 @@ def get_footnotes(footnotes: list[Enum], column: Column) -> list[Enum]:
   return [fn for fn in footnotes if fn.value.column == column]
 
 
+def format_parts_list(parts: list[EnumBase]) -> str:
+  # Returns one line per unique part with its count, sorted by name
+  counts = Counter(parts)
+  return '<br>'.join([f"- {count} {part.value.name}" for part, count in sorted(counts.items(), key=lambda item: str(item[0].value.name))])
+
+
 # TODO: store years as a list
 def get_year_list(years):
   years_list = []
@@ -216,7 +220,7 @@ def get_year_list(years):
 def split_name(name: str) -> tuple[str, str, str]:
   make, model = name.split(" ", 1)
   years = ""
-  match = re.search(MODEL_YEARS_RE, model)
+  match = MODEL_YEARS_RE.search(model)
   if match is not None:
     years = model[match.start():]
     model = model[:match.start() - 1]
@@ -286,15 +290,13 @@ class CarDocs:
     if self.car_parts.parts:
       buy_link = f'<a href="https://comma.ai/shop/comma-3x?harness={self.name}">Buy Here</a>'
 
-      tools_docs = [part for part in self.car_parts.all_parts() if isinstance(part, Tool)]
-      parts_docs = [part for part in self.car_parts.all_parts() if not isinstance(part, Tool)]
-
-      def display_func(parts):
-        return '<br>'.join([f"- {parts.count(part)} {part.value.name}" for part in sorted(set(parts), key=lambda part: str(part.value.name))])
+      tools_docs, parts_docs = [], []
+      for part in self.car_parts.all_parts():
+        (tools_docs if isinstance(part, Tool) else parts_docs).append(part)
 
-      hardware_col = f'<details><summary>Parts</summary><sub>{display_func(parts_docs)}<br>{buy_link}</sub></details>'
+      hardware_col = f'<details><summary>Parts</summary><sub>{format_parts_list(parts_docs)}<br>{buy_link}</sub></details>'
       if len(tools_docs):
-        hardware_col += f'<details><summary>Tools</summary><sub>{display_func(tools_docs)}</sub></details>'
+        hardware_col += f'<details><summary>Tools</summary><sub>{format_parts_list(tools_docs)}</sub></details>'
 
     self.row: dict[Enum, str | Star] = {
       Column.MAKE: self.make,
@@ -384,9 +384,8 @@ def get_interface_attr(attr: str, combine_brands: bool = False, ignore_none: boo
   # - keys are all the car models or brand names
   # - values are attr values from all car folders
   result = {}
-  for car_folder in sorted([x[0] for x in os.walk(BASEDIR)]):
+  for brand_name in sorted(entry.name for entry in os.scandir(BASEDIR) if entry.is_dir() and entry.name != "__pycache__"):
     try:
-      brand_name = car_folder.split('/')[-1]
       brand_values = __import__(f'opendbc.car.{brand_name}.{INTERFACE_ATTR_FILE.get(attr, "values")}', fromlist=[attr])
       if hasattr(brand_values, attr) or not ignore_none:
         attr_data = getattr(brand_values, attr, None)
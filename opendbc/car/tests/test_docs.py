@@ -14,7 +14,7 @@ class TestCarDocs:
     cls.all_cars = get_all_car_docs()
 
   def test_duplicate_years(self, subtests):
-    make_model_years = defaultdict(list)
+    make_model_years = defaultdict(set)
     for car in self.all_cars:
       with subtests.test(car_docs_name=car.name):
         if car.support_type != SupportType.UPSTREAM:
@@ -23,13 +23,12 @@ class TestCarDocs:
         make_model = (car.make, car.model)
         for year in car.year_list:
           assert year not in make_model_years[make_model], f"{car.name}: Duplicate model year"
-          make_model_years[make_model].append(year)
+          make_model_years[make_model].add(year)
 
   def test_missing_car_docs(self, subtests):
-    all_car_docs_platforms = [name for name, config in PLATFORMS.items()]
     for platform in sorted(interfaces.keys()):
       with subtests.test(platform=platform):
-        assert platform in all_car_docs_platforms, f"Platform: {platform} doesn't have a CarDocs entry"
+        assert platform in PLATFORMS, f"Platform: {platform} doesn't have a CarDocs entry"
 
   def test_naming_conventions(self, subtests):
     # Asserts market-standard car naming conventions by brand
@@ -71,8 +70,8 @@ class TestCarDocs:
         if car.name == "comma body" or car.support_type != SupportType.UPSTREAM:
           pytest.skip()
 
-        car_part_type = [p.part_type for p in car.car_parts.all_parts()]
-        car_parts = list(car.car_parts.all_parts())
+        car_parts = car.car_parts.all_parts()
+        car_part_type = [p.part_type for p in car_parts]
         assert len(car_parts) > 0, f"Need to specify car parts: {car.name}"
         assert car_part_type.count(PartType.connector) == 1, f"Need to specify one harness connector: {car.name}"
         assert car_part_type.count(PartType.mount) == 1, f"Need to specify one mount: {car.name}"